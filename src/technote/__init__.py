@@ -1,12 +1,18 @@
 """Rubin Observatory's framework for Sphinx-based technote documents."""
 
+from __future__ import annotations
+
 __all__ = ["__version__", "setup"]
 
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from sphinx.application import Sphinx
+# Importing Sphinx is only needed for type annotations here. Deferring it
+# keeps modules like technote.sources.tomlsettings importable without
+# paying the import cost of Sphinx.
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
 
 __version__: str
 """The version string of technote (:pep:`440` compatible)."""
@@ -17,6 +23,9 @@ except PackageNotFoundError:
     # package is not installed
     __version__ = "0.0.0"
 
+_THEME_PATH = str(Path(__file__).parent.joinpath("theme").resolve())
+"""Path to the technote HTML theme directory."""
+
 
 def setup(app: Sphinx) -> dict[str, Any]:
     """Sphinx entrypoint for technote.
@@ -33,8 +42,7 @@ def setup(app: Sphinx) -> dict[str, Any]:
         The extension version is the same as the package version,
         see `__version__`.
     """
-    theme_path = Path(__file__).parent.joinpath("theme").resolve()
-    app.add_html_theme("technote", str(theme_path))
+    app.add_html_theme("technote", _THEME_PATH)
 
     return {
         "parallel_read_safe": True,
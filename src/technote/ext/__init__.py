@@ -16,11 +16,10 @@ from .abstract import (
     visit_abstract_node_html,
     visit_abstract_node_tex,
 )
-from .insertposttitle import insert_post_title
+from .finalizehtml import finalize_html
 from .metadata import process_html_page_context_for_metadata
 from .pygmentscss import overwrite_pygments_css
 from .toc import process_html_page_context_for_toc
-from .wraptables import wrap_html_tables
 
 __all__ = ["setup"]
 
@@ -43,8 +42,7 @@ def setup(app: Sphinx) -> dict[str, Any]:
 
     app.connect("builder-inited", _add_js_file)
 
-    app.connect("build-finished", wrap_html_tables)
-    app.connect("build-finished", insert_post_title)
+    app.connect("build-finished", finalize_html)
     app.connect("build-finished", overwrite_pygments_css)
 
     return {
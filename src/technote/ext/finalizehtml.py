@@ -0,0 +1,52 @@
+"""A build-finished Sphinx hook that applies the HTML post-processing
+transforms to the technote's page.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import cast
+
+from sphinx.application import Sphinx
+
+from ..templating.context import TechnoteJinjaContext
+from .insertposttitle import insert_post_title_html
+from .wraptables import wrap_tables
+
+__all__ = ["finalize_html"]
+
+
+def finalize_html(app: Sphinx, exceptions: Exception | None = None) -> None:
+    """Post-process the technote's ``index.html`` file.
+
+    The page is read and written once as UTF-8 bytes, and these transforms
+    are applied in memory:
+
+    - Tables are wrapped in figures (see
+      `~technote.ext.wraptables.wrap_tables`).
+    - The post-title templates are inserted below the h1 (see
+      `~technote.ext.insertposttitle.insert_post_title_html`).
+    """
+    if exceptions:
+        return
+
+    # Assumes that technotes consist of only a single index.html file
+    # by definition.
+    html_path = Path(app.builder.outdir) / "index.html"
+    try:
+        html = html_path.read_bytes()
+    except FileNotFoundError:
+        return
+
+    html = wrap_tables(html)
+
+    try:
+        technote_context = app.config.html_context["technote"]
+    except (KeyError, AttributeError):
+        pass
+    else:
+        html = insert_post_title_html(
+            html, cast(TechnoteJinjaContext, technote_context)
+        )
+
+    html_path.write_bytes(html)
@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import cast
 
-from bs4 import BeautifulSoup
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment, PackageLoader, Template, select_autoescape
 from sphinx.application import Sphinx
 
 from ..templating.context import TechnoteJinjaContext
 
-__all__ = ["insert_post_title"]
+__all__ = ["insert_post_title", "insert_post_title_html"]
 
 
 def insert_post_title(app: Sphinx, exceptions: Exception | None) -> None:
@@ -32,20 +32,52 @@ def insert_post_title(app: Sphinx, exceptions: Exception | None) -> None:
 
     technote_context = cast(TechnoteJinjaContext, technote_context)
 
-    # Load template from templates/status.html.jinja
+    html_path = Path(app.builder.outdir) / "index.html"
+    try:
+        html = html_path.read_bytes()
+    except FileNotFoundError:
+        return
+    html_path.write_bytes(insert_post_title_html(html, technote_context))
+
+
+def insert_post_title_html(
+    html: bytes, technote_context: TechnoteJinjaContext
+) -> bytes:
+    """Insert the rendered post-title templates directly after the first
+    ``h1`` element of an HTML document.
+
+    Parameters
+    ----------
+    html
+        The UTF-8 encoded HTML document.
+    technote_context
+        The technote Jinja context used to render the templates.
+
+    Returns
+    -------
+    bytes
+        The transformed HTML document, or the original document if it doesn't
+        have an ``h1`` element.
+    """
+    # Insert the rendered HTML directly after the first </h1> with a string
+    # search rather than parsing and re-serializing the whole page.
+    title_end = html.find(b"</h1>")
+    if title_end < 0:
+        return html
+    title_end += len(b"</h1>")
+    status_html = _load_post_title_template().render(technote=technote_context)
+    return html[:title_end] + status_html.encode("utf-8") + html[title_end:]
+
+
+@cache
+def _load_post_title_template() -> Template:
+    """Load the templates/post-title.html.jinja template.
+
+    The Jinja environment and compiled template are created once and reused
+    by subsequent builds in the same process.
+    """
     jinja_env = Environment(
         loader=PackageLoader("technote", "ext/templates"),
         autoescape=select_autoescape(["html"]),
     )
-    template = jinja_env.get_template("post-title.html.jinja")
-    status_html = template.render(technote=technote_context)
-    status_soup = BeautifulSoup(status_html, "html.parser")
-
-    # Insert the status aside into the technote
-    html_path = Path(app.builder.outdir) / "index.html"
-    if not html_path.is_file():
-        return
-    soup = BeautifulSoup(html_path.read_text(), "html.parser")
-    title = soup.find("h1")
-    title.insert_after(status_soup)
-    html_path.write_text(str(soup))
+    return jinja_env.get_template("post-title.html.jinja")
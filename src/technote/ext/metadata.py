@@ -26,13 +26,11 @@ def get_title(
     config: Config,
 ) -> None:
     """Get the H1 title to use as the technote title."""
-    if doctree is not None:
-        for title_node in doctree.findall(
-            condition=lambda x: isinstance(x, nodes.title)
-        ):
-            title = title_node.astext()
-            context["technote"].set_content_title(title)
-            break
+    if doctree is None:
+        return
+    title_node = next(doctree.findall(nodes.title), None)
+    if title_node is not None:
+        context["technote"].set_content_title(title_node.astext())
 
 
 def get_abstract(
@@ -43,13 +41,11 @@ def get_abstract(
     config: Config,
 ) -> None:
     """Get the abstract as plain text from the abstract directive."""
-    if doctree is not None:
-        for abstract_node in doctree.findall(
-            condition=lambda x: isinstance(x, AbstractNode)
-        ):
-            content = abstract_node.astext()
-            context["technote"].set_abstract(content)
-            break
+    if doctree is None:
+        return
+    abstract_node = next(doctree.findall(AbstractNode), None)
+    if abstract_node is not None:
+        context["technote"].set_abstract(abstract_node.astext())
 
 
 def set_html_title(*, context: dict[str, Any]) -> None:
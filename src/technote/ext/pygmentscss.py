@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
 
 from pygments.formatters import HtmlFormatter
@@ -29,16 +30,23 @@ def overwrite_pygments_css(
         return
 
     pygment_css_path = Path(app.builder.outdir) / "_static" / "pygments.css"
-    if not pygment_css_path.is_file():
+    try:
+        # Open for updating so that the file isn't created if it's missing
+        css_file = pygment_css_path.open("r+")
+    except FileNotFoundError:
         # Handles cases where the html builder isn't running (e.g. link check)
         return
-    pygments_css = _create_pygments_css()
-    pygment_css_path.write_text(pygments_css)
+    with css_file:
+        css_file.write(_create_pygments_css())
+        css_file.truncate()
 
 
+@cache
 def _create_pygments_css() -> str:
     """Create the pygments CSS file that provides both light and dark themes.
 
+    The styles are fixed, so the CSS is generated once per process.
+
     Returns
     -------
     str
@@ -6,6 +6,7 @@ context variable.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from bs4 import BeautifulSoup
@@ -17,6 +18,8 @@ from .abstract import AbstractNode
 
 __all__ = ["process_html_page_context_for_toc"]
 
+logger = logging.getLogger(__name__)
+
 
 def process_html_page_context_for_toc(
     app: Sphinx,
@@ -30,10 +33,12 @@ def process_html_page_context_for_toc(
 
     This function is hooked into the Sphinx ``html-page-context`` event.
     """
-    logger = logging.getLogger(__name__)
-
-    logger.debug(f"In toc, page: {pagename}", location=pagename)
-    logger.debug(f"In toc, template: {templatename}", location=pagename)
+    logger.debug(
+        "In toc, page: %s, template: %s",
+        pagename,
+        templatename,
+        location=pagename,
+    )
     try:
         default_toc_html = context["toc"]
     except KeyError:
@@ -44,12 +49,10 @@ def process_html_page_context_for_toc(
     prepend_sections: list[SyntheticTocSection] = []
 
     # Find an abstract node, which isn't collected by Sphinx for the local toc
-    if doctree:
-        child_abstracts = list(doctree.findall(condition=AbstractNode))
-        if len(child_abstracts) > 0:
-            prepend_sections.append(
-                SyntheticTocSection(label="Abstract", href="#abstract")
-            )
+    if doctree and next(doctree.findall(AbstractNode), None) is not None:
+        prepend_sections.append(
+            SyntheticTocSection(label="Abstract", href="#abstract")
+        )
 
     context["technote_toc"] = transform_toc_html(
         default_toc_html, prepend_sections=prepend_sections
@@ -65,6 +68,16 @@ def transform_toc_html(
     The transformation involves removing the top-level node for the page
     title and adding additional CSS classes.
     """
+    return _transform_toc_html(sphinx_toc, tuple(prepend_sections or ()))
+
+
+@lru_cache(maxsize=32)
+def _transform_toc_html(
+    sphinx_toc: str, prepend_sections: tuple[SyntheticTocSection, ...]
+) -> str:
+    """Transform the Sphinx toc HTML, caching the result for pages that
+    share the same toc (see `transform_toc_html`).
+    """
     soup = BeautifulSoup(sphinx_toc, "html.parser")
     root_list = soup.select_one("li > ul")
 
@@ -72,21 +85,23 @@ def transform_toc_html(
     # extracted by process_html_page_context_for_toc. Therefore create an
     # empty ul.
     if root_list is None:
-        root_list = BeautifulSoup("<ul></ul>", "html.parser").ul
+        root_list = soup.new_tag("ul")
 
     # Add toc entries that aren't part of the Sphinx toc collector (such as
-    # the abstract)
-    if prepend_sections:
-        # reverse order to so we can insert at index 0
-        for section in prepend_sections[::-1]:
-            content = f'<li><a href="{section.href}">{section.label}</a></li>'
-            new_tag = BeautifulSoup(content, "html.parser")
-            root_list.insert(0, new_tag)
+    # the abstract). The tags are built directly rather than parsed from
+    # HTML, which also escapes the labels and hrefs.
+    # Reverse order so we can insert at index 0.
+    for section in prepend_sections[::-1]:
+        item = soup.new_tag("li")
+        link = soup.new_tag("a", href=section.href)
+        link.string = section.label
+        item.append(link)
+        root_list.insert(0, item)
 
     return str(root_list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SyntheticTocSection:
     """An extra section in the TOC outline that wasn't found by Sphinx's
     toc collector (like the abstract).
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 from bs4 import BeautifulSoup
 from sphinx.application import Sphinx
 
-__all___ = ["wrap_html_tables"]
+__all__ = ["wrap_html_tables", "wrap_tables"]
+
+_TABLE_START_PATTERN = re.compile(rb"<table", re.IGNORECASE)
+"""Probe for a table start tag. HTML tag names are case-insensitive, so
+this has to match uppercase tags such as ``<TABLE>`` in raw HTML too.
+"""
 
 
 def wrap_html_tables(app: Sphinx, exceptions: Exception | None = None) -> None:
@@ -25,13 +31,36 @@ def wrap_html_tables(app: Sphinx, exceptions: Exception | None = None) -> None:
     # Assumes that technotes consist of only a single index.html file
     # by definition.
     html_path = Path(app.builder.outdir) / "index.html"
-    if not html_path.is_file():
+    try:
+        html = html_path.read_bytes()
+    except FileNotFoundError:
         return
 
-    soup = BeautifulSoup(html_path.read_text(), "html.parser")
+    html_path.write_bytes(wrap_tables(html))
+
+
+def wrap_tables(html: bytes) -> bytes:
+    """Wrap each ``table`` element of an HTML document in a
+    ``<figure class="technote-table">`` element.
+
+    Parameters
+    ----------
+    html
+        The UTF-8 encoded HTML document.
+
+    Returns
+    -------
+    bytes
+        The transformed HTML document, encoded as UTF-8. A document without
+        tables is returned unchanged, without being parsed.
+    """
+    if _TABLE_START_PATTERN.search(html) is None:
+        return html
+
+    soup = BeautifulSoup(html, "html.parser", from_encoding="utf-8")
     for table_element in soup.find_all("table"):
         figure = soup.new_tag("figure")
         figure.attrs["class"] = "technote-table"
         table_element.wrap(figure)
 
-    html_path.write_text(str(soup))
+    return soup.encode("utf-8")
@@ -37,7 +37,10 @@ class Factory:
         path = Path("technote.toml")
         if not path.is_file():
             raise ConfigError("Cannot find the technote.toml file.")
-        return self.parse_toml(path.read_text())
+        # TOML files are always UTF-8 encoded. Decoding the bytes directly
+        # (as tomllib.load does) avoids read_text's locale-dependent
+        # encoding and its newline translation pass.
+        return self.parse_toml(path.read_bytes().decode())
 
     def parse_toml(self, toml_content: str) -> TechnoteToml:
         """Parse the content of a ``technote.toml`` file."""
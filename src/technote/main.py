@@ -7,9 +7,9 @@ to support their technote plugins and build infrastructure.
 
 from __future__ import annotations
 
-import re
 from collections.abc import MutableMapping
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from .factory import Factory
@@ -22,9 +22,6 @@ __all__ = [
 ]
 
 
-WHITESPACE_PATTERN = re.compile(r"\s+")
-
-
 @dataclass
 class TechnoteSphinxConfig:
     """A class that configures Sphinx in ``conf.py`` to build a technote."""
@@ -84,7 +81,7 @@ class TechnoteSphinxConfig:
         """
         return self.toml.technote.title
 
-    @property
+    @cached_property
     def author(self) -> str:
         """A plaintext expression of the author or authors."""
         if self.metadata.authors:
@@ -96,9 +93,11 @@ class TechnoteSphinxConfig:
 
     def append_extensions(self, extensions: list[str]) -> None:
         """Append user-configured extensions to an existing list."""
+        existing = set(extensions)
         for new_ext in self.toml.technote.sphinx.extensions:
-            if new_ext not in extensions:
+            if new_ext not in existing:
                 extensions.append(new_ext)
+                existing.add(new_ext)
 
     def extend_intersphinx_mapping(
         self, mapping: MutableMapping[str, tuple[str, str | None]]
@@ -106,11 +105,10 @@ class TechnoteSphinxConfig:
         """Extend the ``intersphinx_mapping`` dictionary with configured
         projects.
         """
-        for (
-            project,
-            url,
-        ) in self.toml.technote.sphinx.intersphinx.projects.items():
-            mapping[project] = (str(url), None)
+        projects = self.toml.technote.sphinx.intersphinx.projects
+        mapping.update(
+            (project, (str(url), None)) for project, url in projects.items()
+        )
 
     def append_linkcheck_ignore(self, link_patterns: list[str]) -> None:
         """Append URL patterns for sphinx.linkcheck.ignore to existing
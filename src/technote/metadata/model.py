@@ -22,7 +22,7 @@ __all__ = [
 ]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Organization:
     """The domain model for an organization (e.g. an institution)."""
 
@@ -42,7 +42,7 @@ class Organization:
     """The homepage of the institution."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StructuredName:
     """The domain model for a structured name (e.g. a person's name)."""
 
@@ -58,7 +58,7 @@ class StructuredName:
         return f"{self.given} {self.family}"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Person:
     """The domain model for a person (e.g. an author)."""
 
@@ -78,6 +78,7 @@ class Person:
     """An internal/institutional identifier for a person."""
 
 
+@dataclass(kw_only=True, slots=True)
 class Contributor(Person):
     """The domain model for a contributor."""
 
@@ -88,7 +89,7 @@ class Contributor(Person):
     """A note describing the contribution."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SourceRepository:
     """The domain model for the technote's source code repository."""
 
@@ -105,7 +106,7 @@ class SourceRepository:
     """The current commit in the source code repository."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Link:
     """A link to a webpage."""
 
@@ -149,7 +150,7 @@ class TechnoteState(str, Enum):
     """
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Status:
     """The domain model for the technote's content status."""
 
@@ -163,7 +164,7 @@ class Status:
     """URLs to documents/webpages that superscede the technote."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Citation:
     """Additional information for building a citation to the technote.
 
@@ -178,7 +179,7 @@ class Citation:
     """The ADS bibcode of the technote."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TechnoteMetadata:
     """The domain model for metadata about a technote."""
 
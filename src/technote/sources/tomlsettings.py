@@ -10,9 +10,9 @@
 
 from __future__ import annotations
 
-import re
 import tomllib
 from datetime import UTC, date, datetime
+from functools import cache
 from typing import Any, Self
 
 from pydantic import (
@@ -28,7 +28,6 @@ from ..metadata.model import TechnoteState
 from ..metadata.orcid import validate_orcid_url
 from ..metadata.orcid import verify_checksum as verify_orcid_checksum
 from ..metadata.ror import validate_ror_url
-from ..metadata.spdx import Licenses
 from ..metadata.zenodo import ZenodoRole
 
 __all__ = [
@@ -47,12 +46,29 @@ __all__ = [
 ]
 
 
-WHITESPACE_PATTERN = re.compile(r"\s+")
-
-
 def collapse_whitespace(text: str) -> str:
     """Replace any whitespace character, or group, with a single space."""
-    return WHITESPACE_PATTERN.sub(" ", text).strip()
+    return " ".join(text.split())
+
+
+_ORCID_URL_PREFIXES = ("http://orcid", "https://orcid")
+"""Prefixes of values that are already ORCiD URLs, rather than bare
+ORCiD identifiers.
+"""
+
+
+@cache
+def _load_license_ids() -> frozenset[str]:
+    """Load the set of SPDX license identifiers once per process.
+
+    The `~technote.metadata.spdx` module is imported here, rather than at
+    the module level, because building its Pydantic models is a noticeable
+    part of the import time of this module and is only needed when a
+    technote sets a license.
+    """
+    from ..metadata.spdx import Licenses
+
+    return frozenset(Licenses.load().licenses)
 
 
 def normalize_datetime(v: Any) -> datetime | None:
@@ -95,13 +111,14 @@ def normalize_datetime(v: Any) -> datetime | None:
             return dt.astimezone(UTC)
         else:
             return dt.replace(tzinfo=UTC)
-    if isinstance(v, date):
-        return datetime.combine(v, datetime.min.time(), tzinfo=UTC)
+    # datetime is a subclass of date, so it has to be checked first
     if isinstance(v, datetime):
         if v.tzinfo and v.tzinfo.utcoffset(v) is not None:
             return v.astimezone(UTC)
         else:
             return v.replace(tzinfo=UTC)
+    if isinstance(v, date):
+        return datetime.combine(v, datetime.min.time(), tzinfo=UTC)
     raise ValueError("Cannot parse datetime from value: ", v)
 
 
@@ -196,11 +213,7 @@ class Organization(BaseModel):
     @model_validator(mode="after")
     def check_well_defined(self) -> Self:
         """Ensure that at least the internal ID, ROR, or name are provided."""
-        if self.internal_id:
-            return self
-        if self.ror:
-            return self
-        if self.name:
+        if self.internal_id or self.ror or self.name:
             return self
 
         raise ValueError(
@@ -227,13 +240,20 @@ class PersonName(BaseModel):
         description="The person's given name (first name in western culture).",
     )
 
-    @field_validator("family", "given")
+    @model_validator(mode="before")
     @classmethod
-    def clean_whitespace(cls, v: str | None) -> str | None:
-        if v:
-            return collapse_whitespace(v)
-        else:
-            return v
+    def clean_whitespace(cls, data: Any) -> Any:
+        """Collapse whitespace in the family and given names in a single
+        pass over the input.
+        """
+        if not isinstance(data, dict):
+            return data
+        cleaned = dict(data)
+        for key in ("family", "given"):
+            value = cleaned.get(key)
+            if isinstance(value, str):
+                cleaned[key] = collapse_whitespace(value)
+        return cleaned
 
 
 class Person(BaseModel):
@@ -269,7 +289,7 @@ class Person(BaseModel):
     @classmethod
     def format_orcid_url(cls, value: str) -> str:
         """Format a bare ORCiD identifier as a URL."""
-        if value.startswith(("http://oricid", "https://orcid")):
+        if value.startswith(_ORCID_URL_PREFIXES):
             return value
         if verify_orcid_checksum(value):
             return f"https://orcid.org/{value}"
@@ -307,12 +327,10 @@ class LicenseTable(BaseModel):
     @classmethod
     def validate_spdx_id(cls, v: str) -> str:
         """Ensure that ``id`` is a SPDX license identifier."""
-        if v is not None:
-            licenses = Licenses.load()
-            if v not in licenses:
-                raise ValueError(
-                    f"License ID '{v}' is not a valid SPDX license identifier."
-                )
+        if v not in _load_license_ids():
+            raise ValueError(
+                f"License ID '{v}' is not a valid SPDX license identifier."
+            )
         return v
 
 
@@ -4,14 +4,23 @@ from __future__ import annotations
 
 import os
 from datetime import UTC, datetime
-from importlib.metadata import PackageNotFoundError, version
+from functools import cached_property
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
+from .. import __version__
 from ..metadata.model import TechnoteMetadata
 from .highwire import HighwireMetadata
 from .opengraph import OpenGraphMetadata
 
+__all__ = ["TechnoteJinjaContext"]
+
+_GENERATOR_TAG = (
+    f'<meta name="generator" content="technote {__version__}: '
+    'https://technote.lsst.io" >'
+)
+"""The generator meta tag, which only depends on the technote version."""
+
 
 class TechnoteJinjaContext:
     """A class available to the Jinja context in HTML templates and
@@ -28,6 +37,12 @@ class TechnoteJinjaContext:
     ) -> None:
         self._metadata = metadata
         self._root_filename = root_filename
+        # FIXME: the ref is calculated from GitHub Actions environment
+        # variables, which are read once since they don't change during
+        # a build.
+        # https://docs.github.com/en/actions/learn-github-actions/environment-variables#default-environment-variables
+        self._github_ref_name = os.getenv("GITHUB_REF_NAME")
+        self._github_ref_type = os.getenv("GITHUB_REF_TYPE")
 
     @property
     def metadata(self) -> TechnoteMetadata:
@@ -41,7 +56,7 @@ class TechnoteJinjaContext:
         This title can be derived either from the top-level header in the
         document ``title`` field in ``technote.toml`` if set.
         """
-        return self.metadata.title
+        return self._metadata.title
 
     @property
     def abstract(self) -> str | None:
@@ -51,109 +66,110 @@ class TechnoteJinjaContext:
         markup is removed as part of that process. This attribute can be used
         for populating summary tags in the HTML header.
         """
-        return self.metadata.abstract_plain
+        return self._metadata.abstract_plain
 
-    @property
+    @cached_property
     def date_updated_iso(self) -> str | None:
         """The date updated, as an ISO 8601 string (YYYY-MM-DD)."""
-        if self.metadata.date_updated:
-            return self._format_iso_date(self.metadata.date_updated)
+        if self._metadata.date_updated:
+            return self._format_iso_date(self._metadata.date_updated)
         else:
             return None
 
-    @property
+    @cached_property
     def date_created_iso(self) -> str | None:
         """The date of initial publication, as ISO 8601 (YYYY-MM-DD)."""
-        if self.metadata.date_created:
-            return self._format_iso_date(self.metadata.date_created)
+        if self._metadata.date_created:
+            return self._format_iso_date(self._metadata.date_created)
         else:
             return None
 
-    @property
+    @cached_property
     def datetime_updated_iso(self) -> str | None:
         """The datetime updated, as an ISO 8601 string normalized to UTC."""
-        if self.metadata.date_updated:
-            return self._format_iso_datetime(self.metadata.date_updated)
+        if self._metadata.date_updated:
+            return self._format_iso_datetime(self._metadata.date_updated)
         else:
             return None
 
-    @property
+    @cached_property
     def datetime_created_iso(self) -> str | None:
         """The datetime of initial publication, as an ISO 8601 string
         normalized to UTC.
         """
-        if self.metadata.date_created:
-            return self._format_iso_datetime(self.metadata.date_created)
+        if self._metadata.date_created:
+            return self._format_iso_datetime(self._metadata.date_created)
         else:
             return None
 
     @property
     def version(self) -> str | None:
         """The version, as a string if available."""
-        return self.metadata.version
+        return self._metadata.version
 
     @property
     def canonical_url(self) -> str | None:
         """The canonical URL of the technote, if available."""
-        return str(self.metadata.canonical_url)
+        return str(self._metadata.canonical_url)
 
-    @property
+    @cached_property
     def github_url(self) -> str | None:
         """The GitHub repository URL."""
         if (
-            self.metadata.source_repository is not None
-            and self.metadata.source_repository.url is not None
-            and self.metadata.source_repository.url.startswith(
+            self._metadata.source_repository is not None
+            and self._metadata.source_repository.url is not None
+            and self._metadata.source_repository.url.startswith(
                 "https://github.com"
             )
         ):
-            return str(self.metadata.source_repository.url)
+            return str(self._metadata.source_repository.url)
         return None
 
-    @property
+    @cached_property
+    def _github_root_url(self) -> str | None:
+        """The GitHub repository URL without a ``.git`` suffix, trailing
+        slash, query, or fragment.
+        """
+        if self.github_url is None:
+            return None
+        url_parts = urlsplit(self.github_url)
+        path = url_parts.path.rstrip("/").removesuffix(".git")
+        return f"{url_parts.scheme}://{url_parts.netloc}{path}"
+
+    @cached_property
     def github_repo_slug(self) -> str | None:
         """The GitHub repository slug, ``owner/name``."""
-        if self.github_url is None:
+        if self._github_root_url is None:
             return None
 
-        url_parts = urlparse(self.github_url)
-        slug = "/".join(url_parts.path.lstrip("/").split("/")[:2])
-        return slug.removesuffix(".git")
+        path = urlsplit(self._github_root_url).path
+        return "/".join(path.lstrip("/").split("/", 2)[:2])
 
     @property
     def github_ref_name(self) -> str | None:
         """The branch or tag name."""
-        # FIXME: this is calculated from GitHub Actions environment variables
-        # https://docs.github.com/en/actions/learn-github-actions/environment-variables#default-environment-variables
-        return os.getenv("GITHUB_REF_NAME")
+        return self._github_ref_name
 
     @property
     def github_ref_type(self) -> str | None:
-        """The ref type: branch or tag."""
-        # FIXME: this is calculated from GitHub Actions environment variables
-        # https://docs.github.com/en/actions/learn-github-actions/environment-variables#default-environment-variables
-        return os.getenv("GITHUB_REF_TYPE")
+        """The ref type, either branch or tag."""
+        return self._github_ref_type
 
-    @property
+    @cached_property
     def github_edit_url(self) -> str | None:
         """The URL for editing content on GitHub, from its default branch."""
-        if self.github_url is None:
+        if self._github_root_url is None:
             return None
-        if self.metadata.source_repository is None:
+        if self._metadata.source_repository is None:
             return None
 
-        if self.github_url.endswith(".git"):  # replace with str.removesuffix
-            root_url = self.github_url[:-4]
-        else:
-            root_url = self.github_url
-
         filename = self._root_filename.name
 
         # We're using /blob/ instead of /edit/ to give users the choice of
         # how to edit (on web or in github.dev).
         return (
-            f"{root_url}/blob/"
-            f"{self.metadata.source_repository.branch or 'main'}/{filename}"
+            f"{self._github_root_url}/blob/"
+            f"{self._metadata.source_repository.branch or 'main'}/{filename}"
         )
 
     def set_content_title(self, title: str) -> None:
@@ -161,48 +177,48 @@ class TechnoteJinjaContext:
         # If the title is empty, that indicates that it was not set in
         # technote.toml. We can set it from the content. But if it was set
         # we don't want to override that choice.
-        if self.metadata.title == "":
-            self.metadata.title = title
+        if self._metadata.title == "":
+            self._metadata.title = title
+            self._clear_metadata_tags()
 
     def set_abstract(self, abstract: str) -> None:
         """Set the abstract metadata from the content."""
-        self.metadata.abstract_plain = abstract
+        self._metadata.abstract_plain = abstract
+        self._clear_metadata_tags()
+
+    def _clear_metadata_tags(self) -> None:
+        """Clear the cached metadata tags so they are re-rendered from the
+        updated metadata.
+        """
+        self.__dict__.pop("highwire_metadata_tags", None)
+        self.__dict__.pop("opengraph_metadata_tags", None)
 
     def _format_iso_datetime(self, date: datetime) -> str:
         """Format a date in ISO 8601 format, normalized to UTC."""
-        dt = date.astimezone(UTC)
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        dt = date.astimezone(UTC).replace(tzinfo=None)
+        return dt.isoformat(timespec="seconds") + "Z"
 
     def _format_iso_date(self, date: datetime) -> str:
         """Format a date in ISO 8601 date format, normalized to UTC."""
-        dt = date.astimezone(UTC)
-        return dt.strftime("%Y-%m-%d")
+        return date.astimezone(UTC).date().isoformat()
 
-    @property
+    @cached_property
     def highwire_metadata_tags(self) -> str:
         """The Highwire metadata tags for the technote."""
         highwire = HighwireMetadata(
-            metadata=self.metadata,
+            metadata=self._metadata,
         )
         return highwire.as_html()
 
-    @property
+    @cached_property
     def opengraph_metadata_tags(self) -> str:
         """The OpenGraph metadata tags for the technote."""
         og = OpenGraphMetadata(
-            metadata=self.metadata,
+            metadata=self._metadata,
         )
         return og.as_html()
 
     @property
     def generator_tag(self) -> str:
         """A meta name=generator tag to identify the version of technote."""
-        try:
-            tn_version = version("technote")
-        except PackageNotFoundError:
-            # package is not installed
-            tn_version = "0.0.0"
-        return (
-            f'<meta name="generator" content="technote {tn_version}: '
-            'https://technote.lsst.io" >'
-        )
+        return _GENERATOR_TAG
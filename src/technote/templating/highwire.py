@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import html
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from .metatagbase import MetaTagFormatterBase
@@ -22,6 +24,15 @@ class HighwireMetadata(MetaTagFormatterBase):
     - https://scholar.google.com/intl/en/scholar/inclusion.html#indexing
     """
 
+    tag_attributes = (
+        "title",
+        "author_info",
+        "date",
+        "doi",
+        "technical_report_number",
+        "html_url",
+    )
+
     def __init__(
         self,
         *,
@@ -29,27 +40,13 @@ class HighwireMetadata(MetaTagFormatterBase):
     ) -> None:
         self._metadata = metadata
 
-    @property
-    def tag_attributes(self) -> list[str]:
-        """The names of class properties that create tags."""
-        return [
-            "title",
-            "author_info",
-            "date",
-            "doi",
-            "technical_report_number",
-            "html_url",
-        ]
-
     @property
     def title(self) -> str:
         """The title metadata."""
-        return (
-            f'<meta name="citation_title" content="{ self._metadata.title }">'
-        )
+        return self._format_tag("title", self._metadata.title)
 
     @property
-    def author_info(self) -> list[str]:
+    def author_info(self) -> Iterator[str]:
         """The author metadata.
 
         Each author is represented with these tags:
@@ -58,28 +55,20 @@ class HighwireMetadata(MetaTagFormatterBase):
         - ``citation_author_institution``
         - ``citation_author_email``
         - ``citation_author_orcid``
+
+        The tags are generated lazily, in order, as the iterator is consumed.
         """
-        authors = self._metadata.authors
-        author_tags: list[str] = []
-        for author in authors:
-            author_tags.append(
-                self._format_tag("author", author.name.plain_text_name)
-            )
-            affil_tags = [
-                self._format_tag("author_institution", affiliation.name)
-                for affiliation in author.affiliations
-                if affiliation.name is not None
-            ]
-            author_tags.extend(affil_tags)
+        for author in self._metadata.authors:
+            yield self._format_tag("author", author.name.plain_text_name)
+            for affiliation in author.affiliations:
+                if affiliation.name is not None:
+                    yield self._format_tag(
+                        "author_institution", affiliation.name
+                    )
             if author.email is not None:
-                author_tags.append(
-                    self._format_tag("author_email", author.email)
-                )
+                yield self._format_tag("author_email", author.email)
             if author.orcid is not None:
-                author_tags.append(
-                    self._format_tag("author_orcid", str(author.orcid))
-                )
-        return author_tags
+                yield self._format_tag("author_orcid", str(author.orcid))
 
     @property
     def date(self) -> str | None:
@@ -134,6 +123,7 @@ class HighwireMetadata(MetaTagFormatterBase):
     def _format_tag(self, name: str, content: str) -> str:
         """Format a Highwire metadata tag."""
         return (
-            f'<meta name="citation_{ name }" content="{ content }" '
+            f'<meta name="citation_{ name }" '
+            f'content="{ html.escape(content) }" '
             f'data-highwire="true">'
         )
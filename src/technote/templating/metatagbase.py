@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Any, ClassVar
 
 
-class MetaTagFormatterBase(ABC):
+class MetaTagFormatterBase:
     """A base class for generating HTML meta tags."""
 
+    tag_attributes: ClassVar[tuple[str, ...]]
+    """The names of class properties that create tags, in order.
+
+    Subclasses must set this as a class attribute so that the sequence isn't
+    rebuilt each time the tags are created.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, "tag_attributes"):
+            raise TypeError(
+                f"{cls.__name__} must set the tag_attributes class attribute"
+            )
+
     def __str__(self) -> str:
         """Create the Highwire metadata tags."""
         return self.as_html()
 
-    @property
-    @abstractmethod
-    def tag_attributes(self) -> list[str]:
-        """The names of class properties that create tags."""
-        raise NotImplementedError
-
     def as_html(self) -> str:
         """Create the Highwire metadata HTML tags."""
         tags: list[str] = []
@@ -27,9 +36,11 @@ class MetaTagFormatterBase(ABC):
 
     @staticmethod
     def extend_not_none(
-        entries: list[str], new_item: None | str | list[str]
+        entries: list[str], new_item: None | str | Iterable[str]
     ) -> None:
-        """Extend a list with new items if they are not None."""
+        """Extend a list with a new item, or the items of an iterable, if
+        they are not None.
+        """
         if new_item is None:
             return
         if isinstance(new_item, str):
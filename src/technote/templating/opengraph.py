@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import html
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -21,6 +22,15 @@ class OpenGraphMetadata(MetaTagFormatterBase):
     - https://ogp.me/
     """
 
+    tag_attributes = (
+        "title",
+        "description",
+        "url",
+        "og_type",
+        "authors",
+        "dates",
+    )
+
     def __init__(
         self,
         *,
@@ -28,18 +38,6 @@ class OpenGraphMetadata(MetaTagFormatterBase):
     ) -> None:
         self._metadata = metadata
 
-    @property
-    def tag_attributes(self) -> list[str]:
-        """The names of class properties that create tags."""
-        return [
-            "title",
-            "description",
-            "url",
-            "og_type",
-            "authors",
-            "dates",
-        ]
-
     @property
     def title(self) -> str:
         """The title of the technote."""
@@ -126,4 +124,7 @@ class OpenGraphMetadata(MetaTagFormatterBase):
 
     def _format_tag(self, name: str, content: str) -> str:
         """Format a OpenGraph metadata tag."""
-        return f'<meta property="og:{ name }" content="{ content }" >'
+        return (
+            f'<meta property="og:{ name }" '
+            f'content="{ html.escape(content) }" >'
+        )
@@ -0,0 +1,34 @@
+"""Tests for the technote.ext.insertposttitle module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO
+
+import lxml.html
+import pytest
+from sphinx.application import Sphinx
+from sphinx.util import logging
+
+
+@pytest.mark.sphinx("html", testroot="toc-basic")
+def test_insert_post_title(app: Sphinx, status: IO, warning: IO) -> None:
+    """Test that the post-title templates are inserted directly after the
+    h1 element once the build finishes.
+    """
+    logging.setup(app, status, warning)
+    app.build(force_all=True)
+
+    html_source = Path(app.outdir).joinpath("index.html").read_text()
+    doc = lxml.html.document_fromstring(html_source)
+
+    h1 = doc.cssselect("h1")[0]
+    authors_aside = h1.getnext()
+    assert authors_aside.tag == "aside"
+    assert "technote-inline-authors" in authors_aside.get("class")
+    assert authors_aside.text_content().split() == [
+        "By:",
+        "Jonathan",
+        "Sick",
+    ]
+    assert len(doc.cssselect(".technote-inline-authors")) == 1
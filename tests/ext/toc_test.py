@@ -10,6 +10,8 @@ import pytest
 from sphinx.application import Sphinx
 from sphinx.util import logging
 
+from technote.ext.toc import SyntheticTocSection, transform_toc_html
+
 
 @pytest.mark.sphinx("html", testroot="toc-basic")
 def test_toc_html(app: Sphinx, status: IO, warning: IO) -> None:
@@ -54,3 +56,25 @@ def test_toc_no_sections_html(app: Sphinx, status: IO, warning: IO) -> None:
     abstract_li = toc_ul.cssselect("li")[0]
     assert abstract_li.text_content() == "Abstract"
     assert abstract_li.cssselect("a")[0].get("href") == "#abstract"
+
+
+def test_transform_toc_html() -> None:
+    """Test transform_toc_html directly, including repeated calls that are
+    served from its cache.
+    """
+    sphinx_toc = (
+        '<ul><li><a href="#">Title</a><ul>'
+        '<li><a href="#section-one">Section one</a></li>'
+        "</ul></li></ul>"
+    )
+    abstract = SyntheticTocSection(label="Abstract", href="#abstract")
+    expected = (
+        '<ul><li><a href="#abstract">Abstract</a></li>'
+        '<li><a href="#section-one">Section one</a></li></ul>'
+    )
+
+    assert transform_toc_html(sphinx_toc, [abstract]) == expected
+    assert transform_toc_html(sphinx_toc, [abstract]) == expected
+    assert transform_toc_html(sphinx_toc) == (
+        '<ul><li><a href="#section-one">Section one</a></li></ul>'
+    )
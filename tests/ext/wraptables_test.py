@@ -0,0 +1,29 @@
+"""Tests for the technote.ext.wraptables module."""
+
+from __future__ import annotations
+
+from technote.ext.wraptables import wrap_tables
+
+
+def test_wrap_tables() -> None:
+    html = (
+        b"<html><body><p>Text</p><table><tr><td>1</td></tr></table>"
+        b"</body></html>"
+    )
+    assert wrap_tables(html) == (
+        b'<html><body><p>Text</p><figure class="technote-table"><table><tr>'
+        b"<td>1</td></tr></table></figure></body></html>"
+    )
+
+
+def test_wrap_tables_without_tables() -> None:
+    html = b"<html><body><p>Text<br></p></body></html>"
+    assert wrap_tables(html) is html
+
+
+def test_wrap_tables_uppercase() -> None:
+    html = b"<html><body><TABLE><TR><TD>1</TD></TR></TABLE></body></html>"
+    assert wrap_tables(html) == (
+        b'<html><body><figure class="technote-table"><table><tr><td>1</td>'
+        b"</tr></table></figure></body></html>"
+    )
@@ -0,0 +1,58 @@
+"""Tests for the technote.main module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from technote.factory import Factory
+from technote.main import TechnoteSphinxConfig
+
+sample_toml = """
+[technote]
+id = "SQR-000"
+title = "The LSST DM Technical Note Publishing Platform"
+
+[technote.sphinx]
+extensions = ["sphinx.ext.intersphinx", "sphinxcontrib.mermaid"]
+
+[technote.sphinx.intersphinx.projects]
+python = "https://docs.python.org/3/"
+"""
+
+
+def create_config(toml_content: str) -> TechnoteSphinxConfig:
+    """Create a TechnoteSphinxConfig from technote.toml content."""
+    factory = Factory()
+    toml = factory.parse_toml(toml_content)
+    return TechnoteSphinxConfig(
+        factory=factory,
+        toml=toml,
+        metadata=factory.load_metadata(),
+        root_filename=Path("index.rst"),
+    )
+
+
+def test_append_extensions() -> None:
+    """Test that configured extensions are appended without duplicates."""
+    config = create_config(sample_toml)
+    extensions = ["myst_parser", "sphinx.ext.intersphinx", "technote.ext"]
+    config.append_extensions(extensions)
+    assert extensions == [
+        "myst_parser",
+        "sphinx.ext.intersphinx",
+        "technote.ext",
+        "sphinxcontrib.mermaid",
+    ]
+
+
+def test_extend_intersphinx_mapping() -> None:
+    """Test that configured intersphinx projects extend the mapping."""
+    config = create_config(sample_toml)
+    mapping: dict[str, tuple[str, str | None]] = {
+        "sphinx": ("https://www.sphinx-doc.org/en/master/", None)
+    }
+    config.extend_intersphinx_mapping(mapping)
+    assert mapping == {
+        "sphinx": ("https://www.sphinx-doc.org/en/master/", None),
+        "python": ("https://docs.python.org/3/", None),
+    }
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from technote.sources.tomlsettings import TechnoteToml
+import pytest
+from pydantic import ValidationError
+
+from technote.sources.tomlsettings import TechnoteToml, collapse_whitespace
 
 sample_toml = """
 [technote]
@@ -31,3 +34,74 @@ def test_toml_parsing() -> None:
     """
     technote_toml = TechnoteToml.parse_toml(sample_toml)
     assert technote_toml.technote.id == "SQR-000"
+
+
+def test_invalid_license_id() -> None:
+    """Test that an unknown SPDX license ID is rejected."""
+    invalid_toml = sample_toml.replace("CC-BY-4.0", "Not-A-License")
+    with pytest.raises(ValidationError):
+        TechnoteToml.parse_toml(invalid_toml)
+
+
+def test_collapse_whitespace() -> None:
+    """Test that runs of whitespace, including unicode whitespace, are
+    collapsed into single spaces and stripped from the ends.
+    """
+    assert collapse_whitespace("Rubin Observatory") == "Rubin Observatory"
+    assert collapse_whitespace("  Rubin\n\tObservatory ") == (
+        "Rubin Observatory"
+    )
+    assert collapse_whitespace("Rubin\u00a0\u2003Observatory") == (
+        "Rubin Observatory"
+    )
+    assert collapse_whitespace("") == ""
+
+
+def test_person_name_whitespace() -> None:
+    """Test that whitespace in author names is collapsed."""
+    messy_toml = sample_toml.replace(
+        'name.given = "Jonathan"', 'name.given = " Jonathan\\t"'
+    ).replace('name.family = "Sick"', 'name.family = "Sick \\n"')
+    technote_toml = TechnoteToml.parse_toml(messy_toml)
+    name = technote_toml.technote.authors[0].name
+    assert name.given == "Jonathan"
+    assert name.family == "Sick"
+
+
+def test_undefined_affiliation() -> None:
+    """Test that an affiliation without a name, ror, or internal_id is
+    rejected.
+    """
+    invalid_toml = sample_toml.replace(
+        '{ name = "Rubin Observatory", ror = "https://ror.org/048g3cy84" }',
+        '{ address = "950 N. Cherry Ave., Tucson, AZ" }',
+    )
+    with pytest.raises(ValidationError):
+        TechnoteToml.parse_toml(invalid_toml)
+
+
+@pytest.mark.parametrize(
+    ("orcid", "expected"),
+    [
+        (
+            "0000-0003-3001-676X",
+            "https://orcid.org/0000-0003-3001-676X",
+        ),
+        (
+            "http://orcid.org/0000-0003-3001-676X",
+            "http://orcid.org/0000-0003-3001-676X",
+        ),
+        (
+            "https://orcid.org/0000-0003-3001-676X",
+            "https://orcid.org/0000-0003-3001-676X",
+        ),
+    ],
+)
+def test_orcid_formats(orcid: str, expected: str) -> None:
+    """Test that ORCiDs can be given as bare identifiers or URLs."""
+    orcid_toml = sample_toml.replace(
+        'orcid = "https://orcid.org/0000-0003-3001-676X"',
+        f'orcid = "{orcid}"',
+    )
+    technote_toml = TechnoteToml.parse_toml(orcid_toml)
+    assert str(technote_toml.technote.authors[0].orcid) == expected
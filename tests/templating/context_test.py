@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
 from technote.factory import Factory
+from technote.templating.context import TechnoteJinjaContext
 
 sample_toml = """
 [technote]
@@ -29,20 +31,116 @@ affiliations = [
 """
 
 
+def create_jinja_context(toml_content: str) -> TechnoteJinjaContext:
+    """Create a TechnoteJinjaContext from technote.toml content."""
+    factory = Factory()
+    factory.parse_toml(toml_content)
+    return factory.create_jinja_context(
+        metadata=factory.load_metadata(), root_filename=Path("index.rst")
+    )
+
+
 def test_technote_jinja_context(monkeypatch: MonkeyPatch) -> None:
     """Test TechnoteJinjaContext with the sample toml."""
     monkeypatch.setenv("GITHUB_REF_NAME", "main")
     monkeypatch.setenv("GITHUB_REF_TYPE", "branch")
 
-    factory = Factory()
-    technote_toml = factory.parse_toml(sample_toml)
-    factory._toml = technote_toml
-    metadata = factory.load_metadata()
-    jinja_context = factory.create_jinja_context(
-        metadata=metadata, root_filename=Path("index.rst")
-    )
+    jinja_context = create_jinja_context(sample_toml)
 
     assert jinja_context.github_url == "https://github.com/lsst-sqre/sqr-000"
     assert jinja_context.github_repo_slug == "lsst-sqre/sqr-000"
     assert jinja_context.github_ref_name == "main"
     assert jinja_context.github_ref_type == "branch"
+    assert jinja_context.date_created_iso == "2015-11-18"
+    assert jinja_context.date_updated_iso == "2015-11-23"
+    assert jinja_context.datetime_created_iso == "2015-11-18T00:00:00Z"
+    assert jinja_context.datetime_updated_iso == "2015-11-23T15:00:00Z"
+    assert jinja_context.github_edit_url == (
+        "https://github.com/lsst-sqre/sqr-000/blob/main/index.rst"
+    )
+    assert (
+        '<meta name="citation_author" content="Jonathan Sick" '
+        'data-highwire="true">\n'
+        '<meta name="citation_author_institution" '
+        'content="Rubin Observatory" data-highwire="true">\n'
+        '<meta name="citation_author_orcid" '
+        'content="https://orcid.org/0000-0003-3001-676X" '
+        'data-highwire="true">\n'
+    ) in jinja_context.highwire_metadata_tags
+
+
+def test_metadata_tags_update() -> None:
+    """Test that the metadata tags reflect an abstract set from the
+    content after the tags were first rendered.
+    """
+    jinja_context = create_jinja_context(sample_toml)
+
+    assert "og:description" not in jinja_context.opengraph_metadata_tags
+    jinja_context.set_abstract("An abstract.")
+    assert (
+        '<meta property="og:description" content="An abstract." >'
+        in jinja_context.opengraph_metadata_tags
+    )
+
+
+def test_metadata_tags_escaping() -> None:
+    """Test that text in the metadata tags is escaped for HTML attributes."""
+    jinja_context = create_jinja_context(
+        sample_toml.replace(
+            'title = "The LSST DM Technical Note Publishing Platform"',
+            """title = 'Rock & Roll: "Quoted" <Title>'""",
+        )
+    )
+
+    escaped_title = "Rock &amp; Roll: &quot;Quoted&quot; &lt;Title&gt;"
+    assert (
+        f'<meta name="citation_title" content="{escaped_title}" '
+        'data-highwire="true">'
+    ) in jinja_context.highwire_metadata_tags
+    assert (
+        f'<meta property="og:title" content="{escaped_title}" >'
+    ) in jinja_context.opengraph_metadata_tags
+
+
+@pytest.mark.parametrize(
+    ("github_url", "expected"),
+    [
+        ("https://github.com/lsst-sqre/sqr-000", "lsst-sqre/sqr-000"),
+        ("https://github.com/lsst-sqre/sqr-000.git", "lsst-sqre/sqr-000"),
+        ("https://github.com/lsst-sqre/sqr-000/", "lsst-sqre/sqr-000"),
+        ("https://github.com/o/r?tab=readme", "o/r"),
+        ("https://github.com/o/r#readme", "o/r"),
+        ("https://github.company.com/org/repo", "org/repo"),
+    ],
+)
+def test_github_repo_slug(github_url: str, expected: str) -> None:
+    """Test that the repository slug is taken from the URL path."""
+    jinja_context = create_jinja_context(
+        sample_toml.replace(
+            'github_url = "https://github.com/lsst-sqre/sqr-000"',
+            f'github_url = "{github_url}"',
+        )
+    )
+    assert jinja_context.github_repo_slug == expected
+
+
+@pytest.mark.parametrize(
+    "github_url",
+    [
+        "https://github.com/lsst-sqre/sqr-000",
+        "https://github.com/lsst-sqre/sqr-000.git",
+        "https://github.com/lsst-sqre/sqr-000/",
+        "https://github.com/lsst-sqre/sqr-000?tab=readme",
+    ],
+)
+def test_github_edit_url(github_url: str) -> None:
+    """Test that the edit URL is built from the repository root URL."""
+    jinja_context = create_jinja_context(
+        sample_toml.replace(
+            'github_url = "https://github.com/lsst-sqre/sqr-000"',
+            f'github_url = "{github_url}"',
+        )
+    )
+    assert jinja_context.github_edit_url == (
+        "https://github.com/lsst-sqre/sqr-000/blob/main/index.rst"
+    )
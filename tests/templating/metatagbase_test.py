@@ -0,0 +1,40 @@
+"""Tests for the technote.templating.metatagbase module."""
+
+from __future__ import annotations
+
+import pytest
+
+from technote.templating.metatagbase import MetaTagFormatterBase
+
+
+def test_tag_attributes() -> None:
+    """Test that tags are created in the order of tag_attributes."""
+
+    class Formatter(MetaTagFormatterBase):
+        tag_attributes = ("title", "authors", "missing")
+
+        @property
+        def title(self) -> str:
+            return '<meta name="title">'
+
+        @property
+        def authors(self) -> list[str]:
+            return ['<meta name="a">', '<meta name="b">']
+
+        @property
+        def missing(self) -> None:
+            return None
+
+    assert str(Formatter()) == (
+        '<meta name="title">\n<meta name="a">\n<meta name="b">\n'
+    )
+
+
+def test_missing_tag_attributes() -> None:
+    """Test that a subclass without tag_attributes is rejected when it is
+    defined.
+    """
+    with pytest.raises(TypeError):
+
+        class Formatter(MetaTagFormatterBase):
+            pass